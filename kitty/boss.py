@@ -45,7 +45,7 @@ from .os_window_size import initial_window_size_func
 from .rgb import Color, color_from_int
 from .session import Session, create_sessions, get_os_window_sizing_data
 from .tabs import (
-    SpecialWindow, SpecialWindowInstance, Tab, TabDict, TabManager
+    SpecialWindow, Tab, TabDict, TabManager
 )
 from .typing import PopenType, TypedDict
 from .utils import (
@@ -297,9 +297,9 @@ class Boss:
                             focus_os_window(os_window_id, True)
                         return os_window_id
 
-    def _new_os_window(self, args: Union[SpecialWindowInstance, Iterable[str]], cwd_from: Optional[int] = None) -> int:
-        if isinstance(args, SpecialWindowInstance):
-            sw: Optional[SpecialWindowInstance] = args
+    def _new_os_window(self, args: Union[SpecialWindow, Iterable[str]], cwd_from: Optional[int] = None) -> int:
+        if isinstance(args, SpecialWindow):
+            sw: Optional[SpecialWindow] = args
         else:
             sw = self.args_to_special_window(args, cwd_from) if args else None
         startup_session = next(create_sessions(self.opts, special_window=sw, cwd_from=cwd_from))
@@ -1156,7 +1156,7 @@ class Boss:
         stdin: Optional[str] = None,
         cwd_from: Optional[int] = None,
         as_overlay: bool = False
-    ) -> SpecialWindowInstance:
+    ) -> SpecialWindow:
         w = window or self.active_window
         env, input_data = self.process_stdin_source(w, stdin)
         cmdline = []
@@ -1201,7 +1201,7 @@ class Boss:
         window = self.active_window
         cwd_from = window.child.pid_for_cwd if window else None
 
-        def create_window() -> SpecialWindowInstance:
+        def create_window() -> SpecialWindow:
             return self.special_window_for_cmd(
                 cmd, stdin=source, as_overlay=dest == 'overlay', cwd_from=cwd_from)
 
@@ -1226,7 +1226,7 @@ class Boss:
             env, stdin = self.process_stdin_source(stdin=source, window=window)
             self.run_background_process(cmd, cwd_from=cwd_from, stdin=stdin, env=env)
 
-    def args_to_special_window(self, args: Iterable[str], cwd_from: Optional[int] = None) -> SpecialWindowInstance:
+    def args_to_special_window(self, args: Iterable[str], cwd_from: Optional[int] = None) -> SpecialWindow:
         args = list(args)
         stdin = None
         w = self.active_window
@@ -1247,10 +1247,10 @@ class Boss:
             cmd.append(arg)
         return SpecialWindow(cmd, stdin, cwd_from=cwd_from)
 
-    def _new_tab(self, args: Union[SpecialWindowInstance, Iterable[str]], cwd_from: Optional[int] = None, as_neighbor: bool = False) -> Optional[Tab]:
+    def _new_tab(self, args: Union[SpecialWindow, Iterable[str]], cwd_from: Optional[int] = None, as_neighbor: bool = False) -> Optional[Tab]:
         special_window = None
         if args:
-            if isinstance(args, SpecialWindowInstance):
+            if isinstance(args, SpecialWindow):
                 special_window = args
             else:
                 special_window = self.args_to_special_window(args, cwd_from=cwd_from)
@@ -273,6 +273,10 @@ def nth_window(func: str, rest: str) -> FuncArgsType:
     return func, [num]
 
 
+nth_window_aliases = {
+    which + '_window': i for i, which in enumerate('first second third fourth fifth sixth seventh eighth ninth tenth'.split())}
+
+
 @func_with_args('disable_ligatures_in')
 def disable_ligatures_in(func: str, rest: str) -> FuncArgsType:
     parts = rest.split(maxsplit=1)
@@ -351,6 +355,9 @@ def parse_key_action(action: str) -> Optional[KeyAction]:
     parts = action.strip().split(maxsplit=1)
     func = parts[0]
     if len(parts) == 1:
+        num = nth_window_aliases.get(func)
+        if num is not None:
+            return KeyAction(*nth_window('nth_window', str(num)))
         return KeyAction(func, ())
     rest = parts[1]
     parser = args_funcs.get(func)
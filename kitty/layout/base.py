@@ -296,6 +296,7 @@ class Layout:
         for window, is_group_leader in all_windows.iter_windows_with_visibility():
             is_visible = window is active_window or (is_group_leader and not self.only_active_window_visible)
             window.set_visible_in_layout(is_visible)
+        all_windows.invalidate_visible_groups()
 
     def _set_dimensions(self) -> None:
         lgd.central, tab_bar, vw, vh, lgd.cell_width, lgd.cell_height = viewport_for_window(self.os_window_id)
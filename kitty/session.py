@@ -12,7 +12,7 @@ from .constants import kitty_exe
 from .layout.interface import all_layouts
 from .options_stub import Options
 from .os_window_size import WindowSize, WindowSizeData, WindowSizes
-from .typing import SpecialWindowInstance
+from .typing import SpecialWindowType
 from .utils import log_error, resolved_shell
 from .window import Watchers
 
@@ -28,7 +28,7 @@ def get_os_window_sizing_data(opts: Options, session: Optional['Session'] = None
 class Tab:
 
     def __init__(self, opts: Options, name: str, watchers: Watchers):
-        self.windows: List['SpecialWindowInstance'] = []
+        self.windows: List['SpecialWindowType'] = []
         self.name = name.strip()
         self.active_window_idx = 0
         self.enabled_layouts = opts.enabled_layouts
@@ -49,7 +49,7 @@ class Session:
         self.watchers = Watchers()
 
     def add_watchers_to_all_windows(self, watchers: Watchers) -> None:
-        def add(w: 'SpecialWindowInstance') -> 'SpecialWindowInstance':
+        def add(w: 'SpecialWindowType') -> 'SpecialWindowType':
             if w.watchers is None:
                 return w._replace(watchers=watchers)
             wt = w.watchers.copy()
@@ -88,7 +88,7 @@ class Session:
         t.windows.append(sw)
         t.next_title = None
 
-    def add_special_window(self, sw: 'SpecialWindowInstance') -> None:
+    def add_special_window(self, sw: 'SpecialWindowType') -> None:
         if self.watchers.has_watchers:
             sw = sw._replace(watchers=self.watchers.copy())
         self.tabs[-1].windows.append(sw)
@@ -171,7 +171,7 @@ def parse_session(raw: str, opts: Options, default_title: Optional[str] = None)
 def create_sessions(
     opts: Options,
     args: Optional[CLIOptions] = None,
-    special_window: Optional['SpecialWindowInstance'] = None,
+    special_window: Optional['SpecialWindowType'] = None,
     cwd_from: Optional[int] = None,
     respect_cwd: bool = False,
     default_session: Optional[str] = None
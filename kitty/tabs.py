@@ -5,7 +5,6 @@
 import weakref
 from collections import deque
 from contextlib import suppress
-from functools import partial
 from operator import attrgetter
 from typing import (
     Any, Deque, Dict, Generator, Iterator, List, NamedTuple, Optional, Pattern,
@@ -40,36 +39,23 @@ class TabDict(TypedDict):
     active_window_history: List[int]
 
 
-class SpecialWindowInstance(NamedTuple):
+class SpecialWindow(NamedTuple):
     cmd: Optional[List[str]]
-    stdin: Optional[bytes]
-    override_title: Optional[str]
-    cwd_from: Optional[int]
-    cwd: Optional[str]
-    overlay_for: Optional[int]
-    env: Optional[Dict[str, str]]
-    watchers: Optional[Watchers]
-
-
-def SpecialWindow(
-    cmd: Optional[List[str]],
-    stdin: Optional[bytes] = None,
-    override_title: Optional[str] = None,
-    cwd_from: Optional[int] = None,
-    cwd: Optional[str] = None,
-    overlay_for: Optional[int] = None,
-    env: Optional[Dict[str, str]] = None,
+    stdin: Optional[bytes] = None
+    override_title: Optional[str] = None
+    cwd_from: Optional[int] = None
+    cwd: Optional[str] = None
+    overlay_for: Optional[int] = None
+    env: Optional[Dict[str, str]] = None
     watchers: Optional[Watchers] = None
-) -> SpecialWindowInstance:
-    return SpecialWindowInstance(cmd, stdin, override_title, cwd_from, cwd, overlay_for, env, watchers)
 
 
-def add_active_id_to_history(items: Deque[int], item_id: int, maxlen: int = 64) -> None:
+def add_active_id_to_history(items: Deque[int], item_id: int) -> None:
+    if items and items[-1] == item_id:
+        return
     with suppress(ValueError):
         items.remove(item_id)
     items.append(item_id)
-    if len(items) > maxlen:
-        items.popleft()
 
 
 class Tab:  # {{{
@@ -78,24 +64,27 @@ class Tab:  # {{{
         self,
         tab_manager: 'TabManager',
         session_tab: Optional['SessionTab'] = None,
-        special_window: Optional[SpecialWindowInstance] = None,
+        special_window: Optional[SpecialWindow] = None,
         cwd_from: Optional[int] = None,
         no_initial_window: bool = False
     ):
         self.tab_manager_ref = weakref.ref(tab_manager)
+        # strong reference for the hot paths, dropped in destroy()
+        self._tm: Optional['TabManager'] = tab_manager
         self.os_window_id: int = tab_manager.os_window_id
         self.id: int = add_tab(self.os_window_id)
         if not self.id:
             raise Exception('No OS window with id {} found, or tab counter has wrapped'.format(self.os_window_id))
+        self._id_str = str(self.id)
         self.opts, self.args = tab_manager.opts, tab_manager.args
         self.name = getattr(session_tab, 'name', '')
-        self.enabled_layouts = [x.lower() for x in getattr(session_tab, 'enabled_layouts', None) or self.opts.enabled_layouts]
+        # already lowercased by to_layout_names() when the config/session was parsed
+        self.enabled_layouts = list(getattr(session_tab, 'enabled_layouts', None) or self.opts.enabled_layouts)
         self.borders = Borders(self.os_window_id, self.id, self.opts)
         self.windows = WindowList(self)
-        for i, which in enumerate('first second third fourth fifth sixth seventh eighth ninth tenth'.split()):
-            setattr(self, which + '_window', partial(self.nth_window, num=i))
         self._last_used_layout: Optional[str] = None
         self._current_layout_name: Optional[str] = None
+        self._current_layout_idx = -1
         self.cwd = self.args.directory
         if no_initial_window:
             self._set_current_layout(self.enabled_layouts[0])
@@ -129,10 +118,16 @@ class Tab:  # {{{
             attach_window(self.os_window_id, self.id, window.id)
         self.relayout()
 
-    def _set_current_layout(self, layout_name: str) -> None:
+    def _set_current_layout(self, layout_name: str, idx: Optional[int] = None) -> None:
+        if idx is None:
+            try:
+                idx = self.enabled_layouts.index(layout_name)
+            except ValueError:
+                idx = -1
         self._last_used_layout = self._current_layout_name
         self.current_layout = self.create_layout_object(layout_name)
         self._current_layout_name = layout_name
+        self._current_layout_idx = idx
         self.mark_tab_bar_dirty()
 
     def startup(self, session_tab: 'SessionTab') -> None:
@@ -154,11 +149,11 @@ class Tab:  # {{{
         w = self.active_window
         set_active_window(self.os_window_id, self.id, 0 if w is None else w.id)
         self.mark_tab_bar_dirty()
-        self.relayout_borders()
         self.current_layout.update_visibility(self.windows)
+        self.relayout_borders()
 
     def mark_tab_bar_dirty(self) -> None:
-        tm = self.tab_manager_ref()
+        tm = self._tm
         if tm is not None:
             tm.mark_tab_bar_dirty()
 
@@ -180,7 +175,7 @@ class Tab:  # {{{
 
     def title_changed(self, window: Window) -> None:
         if window is self.active_window:
-            tm = self.tab_manager_ref()
+            tm = self._tm
             if tm is not None:
                 tm.title_changed(self)
 
@@ -193,7 +188,7 @@ class Tab:  # {{{
         self.relayout_borders()
 
     def relayout_borders(self) -> None:
-        tm = self.tab_manager_ref()
+        tm = self._tm
         if tm is not None:
             w = self.active_window
             ly = self.current_layout
@@ -210,14 +205,8 @@ class Tab:  # {{{
 
     def next_layout(self) -> None:
         if len(self.enabled_layouts) > 1:
-            for i, layout_name in enumerate(self.enabled_layouts):
-                if layout_name == self.current_layout.full_name:
-                    idx = i
-                    break
-            else:
-                idx = -1
-            nl = self.enabled_layouts[(idx + 1) % len(self.enabled_layouts)]
-            self._set_current_layout(nl)
+            idx = (self._current_layout_idx + 1) % len(self.enabled_layouts)
+            self._set_current_layout(self.enabled_layouts[idx], idx)
             self.relayout()
 
     def last_used_layout(self) -> None:
@@ -227,12 +216,14 @@ class Tab:  # {{{
 
     def goto_layout(self, layout_name: str, raise_exception: bool = False) -> None:
         layout_name = layout_name.lower()
-        if layout_name not in self.enabled_layouts:
+        try:
+            idx = self.enabled_layouts.index(layout_name)
+        except ValueError:
             if raise_exception:
                 raise ValueError(layout_name)
             log_error('Unknown or disabled layout: {}'.format(layout_name))
             return
-        self._set_current_layout(layout_name)
+        self._set_current_layout(layout_name, idx)
         self.relayout()
 
     def resize_window_by(self, window_id: int, increment: float, is_horizontal: bool) -> Optional[str]:
@@ -329,7 +320,7 @@ class Tab:  # {{{
 
     def new_special_window(
             self,
-            special_window: SpecialWindowInstance,
+            special_window: SpecialWindow,
             location: Optional[str] = None,
             copy_colors_from: Optional[Window] = None,
             allow_remote_control: bool = False,
@@ -391,12 +382,10 @@ class Tab:  # {{{
                 self.windows.make_previous_group_active(-num)
             else:
                 self.current_layout.activate_nth_window(self.windows, num)
-            self.relayout_borders()
 
     def _next_window(self, delta: int = 1) -> None:
         if len(self.windows) > 1:
             self.current_layout.next_window(self.windows, delta)
-            self.relayout_borders()
 
     def next_window(self) -> None:
         self._next_window()
@@ -455,7 +444,7 @@ class Tab:  # {{{
 
     def matches(self, field: str, pat: Pattern) -> bool:
         if field == 'id':
-            return bool(pat.pattern == str(self.id))
+            return bool(pat.pattern == self._id_str)
         if field == 'title':
             return pat.search(self.name or self.title) is not None
         return False
@@ -474,12 +463,13 @@ class Tab:  # {{{
         for w in self.windows:
             w.destroy()
         self.windows = WindowList(self)
+        self._tm = None
 
     def __repr__(self) -> str:
         return 'Tab(title={}, id={})'.format(self.name or self.title, hex(id(self)))
 
     def make_active(self) -> None:
-        tm = self.tab_manager_ref()
+        tm = self._tm
         if tm is not None:
             tm.set_active_tab(self)
 # }}}
@@ -493,9 +483,11 @@ class TabManager:  # {{{
         self.opts, self.args = opts, args
         self.tab_bar_hidden = self.opts.tab_bar_style == 'hidden'
         self.tabs: List[Tab] = []
-        self.active_tab_history: Deque[int] = deque()
+        self._tabs_by_id: Dict[int, Tab] = {}
+        self.active_tab_history: Deque[int] = deque((), 64)
         self.tab_bar = TabBar(self.os_window_id, opts)
         self._active_tab_idx = 0
+        self._tab_bar_dirty = False
 
         if startup_session is not None:
             for t in startup_session.tabs:
@@ -541,6 +533,7 @@ class TabManager:  # {{{
     def _add_tab(self, tab: Tab) -> None:
         visible_before = self.tab_bar_should_be_visible
         self.tabs.append(tab)
+        self._tabs_by_id[tab.id] = tab
         if not visible_before and self.tab_bar_should_be_visible:
             self.tabbar_visibility_changed()
 
@@ -548,6 +541,7 @@ class TabManager:  # {{{
         visible_before = self.tab_bar_should_be_visible
         remove_tab(self.os_window_id, tab.id)
         self.tabs.remove(tab)
+        self._tabs_by_id.pop(tab.id, None)
         if visible_before and not self.tab_bar_should_be_visible:
             self.tabbar_visibility_changed()
 
@@ -561,10 +555,15 @@ class TabManager:  # {{{
             self.resize(only_tabs=True)
 
     def mark_tab_bar_dirty(self) -> None:
-        if self.tab_bar_should_be_visible and not self.tab_bar_hidden:
+        # The C side only clears a flag that is consumed by calling
+        # update_tab_bar_data() on the next render, so there is no need to
+        # call into it again until that has happened.
+        if not self._tab_bar_dirty and self.tab_bar_should_be_visible and not self.tab_bar_hidden:
+            self._tab_bar_dirty = True
             mark_tab_bar_dirty(self.os_window_id)
 
     def update_tab_bar_data(self) -> None:
+        self._tab_bar_dirty = False
         self.tab_bar.update(self.tab_bar_data)
 
     def title_changed(self, tab: Tab) -> None:
@@ -609,10 +608,9 @@ class TabManager:  # {{{
                 old_active_tab_id = self.active_tab_history[tab_num]
             except IndexError:
                 return
-            for idx, tab in enumerate(self.tabs):
-                if tab.id == old_active_tab_id:
-                    self.set_active_tab_idx(idx)
-                    break
+            tab = self._tabs_by_id.get(old_active_tab_id)
+            if tab is not None:
+                self.set_active_tab_idx(self.tabs.index(tab))
 
     def __iter__(self) -> Iterator[Tab]:
         return iter(self.tabs)
@@ -658,9 +656,7 @@ class TabManager:  # {{{
         return count
 
     def tab_for_id(self, tab_id: int) -> Optional[Tab]:
-        for t in self.tabs:
-            if t.id == tab_id:
-                return t
+        return self._tabs_by_id.get(tab_id)
 
     def move_tab(self, delta: int = 1) -> None:
         if len(self.tabs) > 1:
@@ -675,7 +671,7 @@ class TabManager:  # {{{
 
     def new_tab(
         self,
-        special_window: Optional[SpecialWindowInstance] = None,
+        special_window: Optional[SpecialWindow] = None,
         cwd_from: Optional[int] = None,
         as_neighbor: bool = False,
         empty_tab: bool = False,
@@ -706,19 +702,15 @@ class TabManager:  # {{{
     def remove(self, tab: Tab) -> None:
         self._remove_tab(tab)
         next_active_tab = -1
-        while True:
-            try:
-                self.active_tab_history.remove(tab.id)
-            except ValueError:
-                break
+        # add_active_id_to_history() keeps ids unique, so there is at most one entry
+        with suppress(ValueError):
+            self.active_tab_history.remove(tab.id)
 
         if self.opts.tab_switch_strategy == 'previous':
             while self.active_tab_history and next_active_tab < 0:
-                tab_id = self.active_tab_history.pop()
-                for idx, qtab in enumerate(self.tabs):
-                    if qtab.id == tab_id:
-                        next_active_tab = idx
-                        break
+                qtab = self._tabs_by_id.get(self.active_tab_history.pop())
+                if qtab is not None:
+                    next_active_tab = self.tabs.index(qtab)
         elif self.opts.tab_switch_strategy == 'left':
             next_active_tab = max(0, self.active_tab_idx - 1)
 
@@ -732,22 +724,12 @@ class TabManager:  # {{{
     @property
     def tab_bar_data(self) -> List[TabBarData]:
         at = self.active_tab
-        ans = []
-        for t in self.tabs:
-            title = (t.name or t.title or appname).strip()
-            needs_attention = False
-            has_activity_since_last_focus = False
-            for w in t:
-                if w.needs_attention:
-                    needs_attention = True
-                if w.has_activity_since_last_focus:
-                    has_activity_since_last_focus = True
-            ans.append(TabBarData(
-                title, t is at, needs_attention,
-                len(t), t.current_layout.name or '',
-                has_activity_since_last_focus
-            ))
-        return ans
+        return [TabBarData(
+            (t.name or t.title or appname).strip(), t is at,
+            any(w.needs_attention for w in t),
+            len(t), t.current_layout.name or '',
+            any(w.has_activity_since_last_focus for w in t)
+        ) for t in self.tabs]
 
     def activate_tab_at(self, x: int) -> None:
         i = self.tab_bar.tab_at(x)
@@ -764,4 +746,5 @@ class TabManager:  # {{{
         self.tab_bar.destroy()
         del self.tab_bar
         del self.tabs
+        self._tabs_by_id.clear()
 # }}}
@@ -8,7 +8,7 @@ from typing import Tuple
 BossType = ChildType = TabType = WindowType = ScreenType = None
 BadLineType = KeySpec = SequenceMap = KeyActionType = None
 AddressFamily = PopenType = Socket = StartupCtx = None
-SessionTab = SessionType = LayoutType = SpecialWindowInstance = None
+SessionTab = SessionType = LayoutType = SpecialWindowType = None
 MarkType = RemoteCommandType = CoreTextFont = FontConfigPattern = None
 KeyEventType = ImageManagerType = KittyCommonOpts = HandlerType = None
 GRT_t = GRT_a = GRT_d = GRT_f = GRT_m = GRT_o = None
@@ -27,7 +27,7 @@ from .layout.base import Layout as LayoutType  # noqa
 from .rc.base import RemoteCommand as RemoteCommandType  # noqa
 from .session import Session as SessionType, Tab as SessionTab  # noqa
 from .tabs import (  # noqa
-    SpecialWindowInstance as SpecialWindowInstance, Tab as TabType
+    SpecialWindow as SpecialWindowType, Tab as TabType
 )
 from .utils import ScreenSize as ScreenSize  # noqa
 from .window import Window as WindowType  # noqa
@@ -125,7 +125,9 @@ class WindowList:
     def __init__(self, tab: TabType) -> None:
         self.all_windows: List[WindowType] = []
         self.id_map: Dict[int, WindowType] = {}
+        self.window_to_group: Dict[int, WindowGroup] = {}
         self.groups: List[WindowGroup] = []
+        self._visible_groups: Optional[Tuple[WindowGroup, ...]] = None
         self._active_group_idx: int = -1
         self.active_group_history: Deque[int] = deque((), 64)
         self.tabref = weakref.ref(tab)
@@ -208,8 +210,17 @@ class WindowList:
             for window in g:
                 yield window, window.id == aw
 
+    def invalidate_visible_groups(self) -> None:
+        self._visible_groups = None
+
+    @property
+    def visible_groups(self) -> Tuple[WindowGroup, ...]:
+        if self._visible_groups is None:
+            self._visible_groups = tuple(g for g in self.groups if g.is_visible_in_layout)
+        return self._visible_groups
+
     def iter_all_layoutable_groups(self, only_visible: bool = False) -> Iterator[WindowGroup]:
-        return iter(g for g in self.groups if g.is_visible_in_layout) if only_visible else iter(self.groups)
+        return iter(self.visible_groups) if only_visible else iter(self.groups)
 
     def make_previous_group_active(self, which: int = 1, notify: bool = True) -> None:
         which = max(1, which)
@@ -232,15 +243,12 @@ class WindowList:
 
     def group_for_window(self, x: WindowOrId) -> Optional[WindowGroup]:
         q = self.id_map[x] if isinstance(x, int) else x
-        for g in self.groups:
-            if q in g:
-                return g
+        return self.window_to_group.get(q.id)
 
     def group_idx_for_window(self, x: WindowOrId) -> Optional[int]:
-        q = self.id_map[x] if isinstance(x, int) else x
-        for i, g in enumerate(self.groups):
-            if q in g:
-                return i
+        g = self.group_for_window(x)
+        if g is not None:
+            return self.groups.index(g)
 
     def windows_in_group_of(self, x: WindowOrId) -> Iterator[WindowType]:
         g = self.group_for_window(x)
@@ -264,13 +272,11 @@ class WindowList:
 
     def set_active_window_group_for(self, x: WindowOrId) -> None:
         try:
-            q = self.id_map[x] if isinstance(x, int) else x
+            idx = self.group_idx_for_window(x)
         except KeyError:
             return
-        for i, group in enumerate(self.groups):
-            if q in group:
-                self.set_active_group_idx(i)
-                break
+        if idx is not None:
+            self.set_active_group_idx(idx)
 
     def add_window(
         self,
@@ -282,18 +288,14 @@ class WindowList:
     ) -> WindowGroup:
         self.all_windows.append(window)
         self.id_map[window.id] = window
+        self.invalidate_visible_groups()
         target_group: Optional[WindowGroup] = None
 
         if group_of is not None:
             target_group = self.group_for_window(group_of)
         if target_group is None and next_to is not None:
-            q = self.id_map[next_to] if isinstance(next_to, int) else next_to
-            pos = -1
-            for i, g in enumerate(self.groups):
-                if q in g:
-                    pos = i
-                    break
-            if pos > -1:
+            pos = self.group_idx_for_window(next_to)
+            if pos is not None:
                 target_group = WindowGroup()
                 self.groups.insert(pos + (0 if before else 1), target_group)
         if target_group is None:
@@ -305,11 +307,9 @@ class WindowList:
 
         old_active_window = self.active_window
         target_group.add_window(window)
+        self.window_to_group[window.id] = target_group
         if make_active:
-            for i, g in enumerate(self.groups):
-                if g is target_group:
-                    self.set_active_group_idx(i, notify=False)
-                    break
+            self.set_active_group_idx(self.groups.index(target_group), notify=False)
         new_active_window = self.active_window
         if new_active_window is not old_active_window:
             self.notify_on_active_window_change(old_active_window, new_active_window)
@@ -323,16 +323,18 @@ class WindowList:
         except ValueError:
             pass
         self.id_map.pop(q.id, None)
-        for i, g in enumerate(tuple(self.groups)):
+        self.invalidate_visible_groups()
+        g = self.window_to_group.pop(q.id, None)
+        if g is not None:
             g.remove_window(q)
             if not g:
+                i = self.groups.index(g)
                 del self.groups[i]
                 if self.groups:
                     if self.active_group_idx == i:
                         self.make_previous_group_active(notify=False)
                 else:
                     self._active_group_idx = -1
-                break
         new_active_window = self.active_window
         if old_active_window is not new_active_window:
             self.notify_on_active_window_change(old_active_window, new_active_window)
@@ -361,6 +363,7 @@ class WindowList:
             if target == self.active_group_idx:
                 return False
             self.groups[self.active_group_idx], self.groups[target] = self.groups[target], self.groups[self.active_group_idx]
+            self.invalidate_visible_groups()
             self.set_active_group_idx(target)
             return True
         return False
@@ -371,8 +374,4 @@ class WindowList:
 
     @property
     def num_visble_groups(self) -> int:
-        ans = 0
-        for gr in self.groups:
-            if gr.is_visible_in_layout:
-                ans += 1
-        return ans
+        return len(self.visible_groups)
@@ -237,6 +237,48 @@ class TestLayout(BaseTest):
             q = create_layout(layout_class)
             self.do_overlay_test(q)
 
+    def test_window_list_lookups(self):
+
+        def check(windows):
+            for w in windows:
+                expected = [i for i, g in enumerate(windows.groups) if w in g]
+                self.ae(len(expected), 1)
+                self.assertIs(windows.group_for_window(w), windows.groups[expected[0]])
+                self.ae(windows.group_idx_for_window(w.id), expected[0])
+            self.ae(windows.num_visble_groups, sum(1 for g in windows.groups if g.is_visible_in_layout))
+            self.ae(
+                [g.id for g in windows.iter_all_layoutable_groups(only_visible=True)],
+                [g.id for g in windows.groups if g.is_visible_in_layout])
+
+        for layout_class in (Stack, Tall):
+            q = create_layout(layout_class)
+            windows = create_windows(q)
+            q(windows)
+            check(windows)
+            windows.add_window(Window(6), group_of=windows.active_window)
+            check(windows)
+            windows.add_window(Window(7), next_to=3)
+            check(windows)
+            windows.add_window(Window(8), next_to=2, before=True)
+            check(windows)
+            q.add_window(windows, Window(9), overlay_for=4)
+            check(windows)
+            q.move_window(windows, 2)
+            check(windows)
+            windows.move_window_group(to_group=windows.groups[0].id)
+            check(windows)
+            for i in range(windows.num_groups):
+                q.activate_nth_window(windows, i)
+                check(windows)
+            windows.remove_window(6)
+            check(windows)
+            windows.remove_window(windows.active_window)
+            check(windows)
+            windows.remove_window(4)
+            check(windows)
+            q(windows)
+            check(windows)
+
     def test_splits(self):
         q = create_layout(Splits)
         all_windows = create_windows(q, num=0)